@@ -1,5 +1,12 @@
 import os
 import re
+import sys
+
+# item prefixes and todo markers, built once instead of for every node
+_TODO_RE = re.compile(r"^\[.?\]")
+_REGULAR_RE = re.compile("- *")
+_TODO_STATUS = {" ": False, "x": True}
+_TODO_MARKERS = {True: "[x] ", False: "[] ", None: "[?] "}
 
 
 class TreeNode(object):
@@ -26,30 +33,29 @@ class TreeNode(object):
         else:
             self.type = "regular"
         # regular item
-        regex = re.compile("- *")
-        if re.match(regex, self.data.lower()):
+        if _REGULAR_RE.match(self.data):
             self.data = self.data[1:].strip()
 
     def is_todo(self):
-        regex1 = re.compile("^\[.\]")
-        regex2 = re.compile("^\[\]")
-        if re.match(regex1, self.data.lower()) or re.match(regex2, self.data.lower()):
+        # most items are not todos, skip the regex unless it can match
+        if not self.data.startswith("["):
+            return False
+        # match on the lowercased text, lower() can change its length
+        if _TODO_RE.match(self.data.lower()):
             return True
         else:
             return False
 
     def todo_status(self):
-        if self.data.lower().startswith("[]"):
+        if self.data.startswith("[]"):
             done = False
             data = self.data[2:].strip()
-        elif self.data.lower().startswith("[ ]"):
-            done = False
-            data = self.data[3:].strip()
-        elif self.data.lower().startswith("[x]"):
-            done = True
-            data = self.data[3:].strip()
         else:
-            done = None
+            # "[ ]", "[x]" or "[X]", anything else is unknown
+            if len(self.data) > 2 and self.data[0] == "[" and self.data[2] == "]":
+                done = _TODO_STATUS.get(self.data[1].lower())
+            else:
+                done = None
             data = self.data[3:].strip()
         self.status = done
         # I'll probably need to extend this status to a dict with different statuses for different things. At the moment I don't know what other statuses I might need though, so I'm living it as only for todo items.
@@ -68,64 +74,67 @@ def build_tree_from_text(text_lines):
 
     for line in text_lines:
         line = line.replace("\t", " " * 4)
-        depth = 0
-        while line.startswith(" " * 4):
-            depth += 1
-            line = line[4:]
+        depth = (len(line) - len(line.lstrip(" "))) // 4
+        line = line[4 * depth :]
         if len(line.strip()):
-            while stack and depth <= stack[-1][0]:
+            # the root sits at depth -1 and is never popped
+            while depth <= stack[-1][0]:
                 stack.pop()
-            if stack:
-                parent_depth, parent = stack[-1]
-                node_numbering = parent.name + str(len(parent.children)) + "."
-                node = TreeNode(name=node_numbering, data=line)
-                parent.add_child(node)  # Add node as a child of the parent
+            parent_depth, parent = stack[-1]
+            node_numbering = parent.name + str(len(parent.children)) + "."
+            node = TreeNode(name=node_numbering, data=line)
+            parent.add_child(node)  # Add node as a child of the parent
             stack.append((depth, node))
 
     return root
 
 
 def get_node(root, address):
-    adr = [int(a) for a in address.split(".") if a != ""]
-    parent = root
-    while len(adr):
-        node = parent.children[adr[0]]
-        adr = adr[1:]
-        parent = node
+    node = root
+    for a in address.split("."):
+        if a != "":
+            node = node.children[int(a)]
     return node
 
 
 def print_tree(node, depth=0, numbered=False, decor="type"):
-    if numbered:
-        num_str = f"{node.name} "
-    else:
-        num_str = ""
-    # decorate start of line
-    line_start = decor
-    if decor == "type":
-        if node.type == "todo":
-            if node.status == True:
-                line_start = "[x] "
-            elif node.status == False:
-                line_start = "[] "
-            else:
-                line_start = "[?] "
-        elif node.type == "regular":
-            line_start = "- "
-    # do not print root
-    if node.type == "root":
-        pass
-    # print all children
-    else:
-        print_str = f"{' ' * 4 * (depth - 1)}{line_start}{num_str}{node.data}"
-        print(print_str)
-    for child in node.children:
-        print_tree(child, depth + 1, numbered=numbered, decor=decor)
+    out = []
+    _print_tree_lines(node, depth, numbered, decor, out)
+    if out:
+        sys.stdout.write("\n".join(out) + "\n")
+
+
+def _print_tree_lines(node, depth, numbered, decor, out):
+    stack = [(node, depth)]
+    while stack:
+        node, depth = stack.pop()
+        if numbered:
+            num_str = f"{node.name} "
+        else:
+            num_str = ""
+        # decorate start of line
+        line_start = decor
+        if decor == "type":
+            if node.type == "todo":
+                line_start = _TODO_MARKERS.get(node.status, "[?] ")
+            elif node.type == "regular":
+                line_start = "- "
+        # do not print root
+        if node.type == "root":
+            pass
+        # collect the node, its children are visited next
+        else:
+            print_str = f"{' ' * 4 * (depth - 1)}{line_start}{num_str}{node.data}"
+            out.append(print_str)
+        # leaves push nothing, and a list avoids building a generator per node
+        if node.children:
+            d1 = depth + 1
+            stack.extend([(child, d1) for child in reversed(node.children)])
 
 
 def build_tree_from_file(file_path):
     with open(file_path, "r") as file:
-        text_lines = file.readlines()
-    root = build_tree_from_text(text_lines)
+        # stream lines straight into the parser instead of materializing them
+        root = build_tree_from_text(file)
     root.data = file_path
     return root